@@ -1,5 +1,5 @@
-from .colour import Color, Colour, color_scale, colour_scale
+from .colour import Color, Colour, color_scale, colour_scale, hsl_scale
 
-__all__ = ["Color", "Colour", "color_scale", "colour_scale"]
+__all__ = ["Color", "Colour", "color_scale", "colour_scale", "hsl_scale"]
 
 __version__ = "1.0.0"
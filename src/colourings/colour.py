@@ -1,93 +1,144 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import math
+import operator
+import sys
 import warnings
 from collections.abc import Callable, Generator, Sequence
 from typing import Any
 
 from .conversions import (
+    _hsl2rgb,
     hex2hsl,
     hex2rgb,
     hex2web,
     hsl2hsla,
     hsl2hslaf,
     hsl2hslf,
-    hsl2rgb,
-    hsl2rgbf,
     hsla2hsl,
     hslf2hsl,
     rgb2hex,
     rgb2hsl,
     rgb2rgba,
     rgb2rgbaf,
+    rgb2rgbf,
     rgba2hsl,
     rgbaf2hsl,
     rgbf2hsl,
     web2hex,
     web2hsl,
 )
-from .definitions import COLOR_NAME_TO_RGB, linspace
+from .definitions import COLOR_NAME_TO_RGB, RGB_TO_COLOR_NAMES
 from .identify import (
+    is_hex,
     is_hsl,
     is_hsla,
-    is_long_hex,
     is_rgb,
     is_rgba,
-    is_short_hex,
-    is_web,
 )
 
 
-class C_HSL:
+class _ColorNames:
+    """Attribute access to a table of named colors, case insensitive."""
+
+    _by_name: dict[str, Any]
+
     def __getattr__(self, value):
-        label = value.lower()
-        if label in COLOR_NAME_TO_RGB:
-            return rgb2hsl(COLOR_NAME_TO_RGB[label])
-        raise AttributeError(f"{self.__class__} instance has no attribute {value}")
+        try:
+            return self._by_name[value.lower()]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__} instance has no attribute {value}"
+            ) from None
 
 
-HSL = C_HSL()
+class C_HSL(_ColorNames):
+    """HSL colors container. Provides a quick color access."""
 
+    _by_name = {name: rgb2hsl(rgb) for name, rgb in COLOR_NAME_TO_RGB.items()}
 
-class C_RGB:
-    """RGB colors container. Provides a quick color access."""
 
-    def __getattr__(self, value):
-        return hsl2rgb(getattr(HSL, value))
+## One float tuple per named RGB value, shared by all the names of that color
+_NAMED_RGB = {
+    (r, g, b): (float(r), float(g), float(b)) for r, g, b in RGB_TO_COLOR_NAMES
+}
 
 
-class C_HEX:
+class C_RGB(_ColorNames):
     """RGB colors container. Provides a quick color access."""
 
-    def __getattr__(self, value):
-        return rgb2hex(getattr(RGB, value))
+    _by_name = {name: _NAMED_RGB[rgb] for name, rgb in COLOR_NAME_TO_RGB.items()}
+
+
+class C_HEX(_ColorNames):
+    """HEX colors container. Provides a quick color access."""
 
+    _by_name = {
+        name: sys.intern(rgb2hex(rgb)) for name, rgb in COLOR_NAME_TO_RGB.items()
+    }
 
+
+HSL = C_HSL()
 RGB = C_RGB()
 HEX = C_HEX()
 
 
-def color_scale(
+def _interp_hsl(
+    h1: float,
+    s1: float,
+    l1: float,
+    h2: float,
+    s2: float,
+    l2: float,
+    num: int,
+    include_start: bool = True,
+) -> list[tuple[float, float, float]]:
+    """Linearly interpolate ``num`` HSL values between two colours, endpoints included.
+
+    With ``include_start=False`` the start colour is left out, as it is already
+    the end colour of the previous section of a scale.
+
+    Hues are given as a fraction of a turn (possibly above 1 to encode the
+    wrap around) and are returned in degrees. All three channels are computed
+    in a single pass rather than one `linspace` per channel. The last value is
+    the end colour exactly, so rounding never pushes it outside the HSL range.
+    """
+    n = num - 1
+    dh = (h2 - h1) / n
+    ds = (s2 - s1) / n
+    dl = (l2 - l1) / n
+    out = [
+        (((h1 + dh * i) * 360) % 360, s1 + ds * i, l1 + dl * i)
+        for i in range(0 if include_start else 1, n)
+    ]
+    out.append(((h2 * 360) % 360, s2, l2))
+    return out
+
+
+def hsl_scale(
     colors: Sequence[Color | Colour], num_steps: int, longer: bool = False
-) -> list[Color]:
-    """Create a color scale using many colours via linear interpolation of hsl.
+) -> list[tuple[float, float, float]]:
+    """Create a scale of HSL values using many colours via linear interpolation of hsl.
 
-    TODO: implement better interpolation technique: https://www.alanzucconi.com/2016/01/06/colour-interpolation/
+    Same as `color_scale`, but returns the raw HSL tuples instead of wrapping
+    each step in a `Color`. Use this when the values are passed straight on,
+    e.g. converted with `conversions.hsl2rgbf` for a plotting library.
 
     Parameters
     ----------
     colors : Sequence[Color  |  Colour]
         Sequence of Color objects
-    nb : int
+    num_steps : int
         Total number of steps
     longer : bool, optional
         Long or short path, by default False
 
-    Yields
-    ------
-    list[Color]
-        List of Color objects
+    Returns
+    -------
+    list[tuple[float, float, float]]
+        List of HSL values
 
     Raises
     ------
@@ -106,7 +157,7 @@ def color_scale(
     num_sections = len(colors) - 1
     num_steps_per_iter = math.floor((num_steps - len(colors)) / num_sections)
     remainder = ((num_steps - len(colors)) / num_sections) % 1
-    out = []
+    out: list[tuple[float, float, float]] = []
     added = 0
     for i in range(num_sections):
         # colour definitions
@@ -114,11 +165,11 @@ def color_scale(
         h2, s2, l2 = colors[i + 1].hsl
         h1 /= 360.0
         h2 /= 360.0
-        if longer == (abs(h1 - h2) < 0.5):
-            if h1 < h2:
-                h1 += 1
-            else:
-                h2 += 1
+        # move the lower hue up a full turn to take the other way around
+        wrap = longer == (abs(h1 - h2) < 0.5)
+        h1_lower = h1 < h2
+        h1 += wrap and h1_lower
+        h2 += wrap and not h1_lower
 
         # number of colours
         num_colors = num_steps_per_iter + 2  # add 2 for start and end colours
@@ -126,20 +177,42 @@ def color_scale(
             num_colors += 1
             added += 1
 
-        # interpolate
-        hs = [(v * 360) % 360 for v in linspace(h1, h2, num_colors)]
-        ss = linspace(s1, s2, num_colors)
-        ls = linspace(l1, l2, num_colors)
-        add = [Color(hsl=(_h, _s, _l)) for _h, _s, _l in zip(hs, ss, ls, strict=False)]
-
-        # add to output
-        if i == 0:
-            out.extend(add)
-        else:
-            out.extend(add[1:])
+        # interpolate, the start colour of every section but the first is
+        # already in the output
+        out.extend(_interp_hsl(h1, s1, l1, h2, s2, l2, num_colors, i == 0))
     return out
 
 
+def color_scale(
+    colors: Sequence[Color | Colour], num_steps: int, longer: bool = False
+) -> list[Color]:
+    """Create a color scale using many colours via linear interpolation of hsl.
+
+    TODO: implement better interpolation technique: https://www.alanzucconi.com/2016/01/06/colour-interpolation/
+
+    Parameters
+    ----------
+    colors : Sequence[Color  |  Colour]
+        Sequence of Color objects
+    num_steps : int
+        Total number of steps
+    longer : bool, optional
+        Long or short path, by default False
+
+    Returns
+    -------
+    list[Color]
+        List of Color objects
+
+    Raises
+    ------
+    ValueError
+        Number of colors specified must be at least two
+    """
+    from_hsl = Color._from_hsl_unchecked  # bound once, not looked up per step
+    return [from_hsl(hsl) for hsl in hsl_scale(colors, num_steps, longer)]
+
+
 colour_scale = color_scale
 
 
@@ -152,86 +225,89 @@ def hash_or_str(obj) -> str | int:
         return type(obj).__name__ + str(obj)
 
 
+_PICKER_MAX = 65535.0  # largest 16 bit number
+
+
+@functools.lru_cache(maxsize=4096)
+def _picked_hsl(key: str) -> tuple[float, float, float]:
+    ## Hash the input into 6 bytes, i.e. one 16 bit number per RGB channel.
+    digest = hashlib.shake_128(key.encode("utf-8")).digest(6)
+
+    ## Scale each 16 bit number down to the 0..1 range.
+    components = [
+        int.from_bytes(digest[i : i + 2], "big") / _PICKER_MAX for i in range(0, 6, 2)
+    ]
+    return rgbf2hsl(components)
+
+
 def RGB_color_picker(obj) -> Color:
     """Build a color representation from the string representation of an object.
 
     This allows to quickly get a color from some data, with the
     additional benefit that the color will be the same as long as the
     (string representation of the) data is the same.
+
+    The hashing is cached per string, but a new `Color` is returned on every
+    call so callers are free to modify it.
     """
+    return Color(hsl=_picked_hsl(str(obj)))  ## Profit!
 
-    ## Turn the input into a by 3-dividable string. SHA-384 is good because it
-    ## divides into 3 components of the same size, which will be used to
-    ## represent the RGB values of the color.
-    digest = hashlib.sha384(str(obj).encode("utf-8")).hexdigest()
 
-    ## Split the digest into 3 sub-strings of equivalent size.
-    subsize = int(len(digest) / 3)
-    splitted_digest = [digest[i * subsize : (i + 1) * subsize] for i in range(3)]
+def RGB_equivalence(c1: Color, c2: Color) -> bool:
+    return c1.get_hex_l() == c2.get_hex_l()
 
-    ## Convert those hexadecimal sub-strings into integer and scale them down
-    ## to the 0..1 range.
-    max_value = float(int("f" * subsize, 16))
-    components = [
-        int(d, 16)  ## Make a number from a list with hex digits
-        / max_value  ## Scale it down to [0.0, 1.0]
-        for d in splitted_digest
-    ]
 
-    return Color(rgb2hex(components))  ## Profit!
+def HSL_equivalence(c1: Color, c2: Color) -> bool:
+    return c1._hsl == c2._hsl
+
 
+@functools.lru_cache(maxsize=512)
+def _cached_hsl_from_web(web: str) -> tuple[float, float, float]:
+    return web2hsl(web)
 
-def RGB_equivalence(c1: Color, c2: Color) -> bool:
-    return c1.hex_l == c2.hex_l
 
+def _hsl_of_color(color: Color) -> tuple[float, float, float]:
+    return color.get_hsl()
 
-def HSL_equivalence(c1: Color, c2: Color) -> bool:
-    return c1._hsl == c2._hsl
+
+def _hsl_of_hsl(hsl: Sequence[int | float]) -> Sequence[int | float]:
+    return hsl
 
 
 def identify_color(
     color: str | Sequence[int | float] | Color | Colour,
 ) -> Callable[[Any], Any]:
-    # checks
-    if (
-        isinstance(color, Sequence)
-        and len(color) == 3
-        and is_rgb(color)
-        and is_hsl(color)
-    ):
-        raise TypeError("Cannot determine whether color is RGB or HSL.")
-    elif (
-        isinstance(color, Sequence)
-        and len(color) == 4
-        and is_rgba(color)
-        and is_hsla(color)
-    ):
-        raise TypeError("Cannot determine whether color is RGBA or HSLA.")
-    else:
-        pass
-
-    # identify colour
-    if isinstance(color, Color | Colour):
-        return lambda x: x.hsl
-    elif (
-        isinstance(color, str)
-        and is_long_hex(color)
-        or isinstance(color, str)
-        and is_short_hex(color)
-    ):
-        return hex2hsl
-    elif isinstance(color, str) and is_web(color):
-        return web2hsl
-    elif isinstance(color, Sequence) and is_rgb(color):
-        return rgb2hsl
-    elif isinstance(color, Sequence) and is_hsl(color):
-        return lambda x: x
-    # elif isinstance(color, Sequence) and is_rgba(color): NOTE: unreachable
-    #     return rgba2hsl
-    # elif isinstance(color, Sequence) and is_hsla(color): NOTE: unreachable
-    #     return hsla2hsl
-    else:
-        raise TypeError("Cannot identify color.")
+    if isinstance(color, Color):
+        return _hsl_of_color
+    if isinstance(color, str):
+        if is_hex(color):
+            return hex2hsl
+        if color in COLOR_NAME_TO_RGB:
+            return _cached_hsl_from_web
+    elif isinstance(color, Sequence):
+        if is_rgb(color):
+            if is_hsl(color):
+                raise TypeError("Cannot determine whether color is RGB or HSL.")
+            return rgb2hsl
+        if is_hsl(color):
+            return _hsl_of_hsl
+        if is_rgba(color) and is_hsla(color):
+            raise TypeError("Cannot determine whether color is RGBA or HSLA.")
+    raise TypeError("Cannot identify color.")
+
+
+def _color_property(label: str, settable: bool = True) -> property:
+    """Property calling ``get_<label>``/``set_<label>`` on the instance.
+
+    The methods are looked up on each access, so subclasses overriding them
+    also change the attribute.
+    """
+    setter_name = "set_" + label
+
+    def fset(self: Color, value: Any) -> None:
+        getattr(self, setter_name)(value)
+
+    return property(operator.methodcaller("get_" + label), fset if settable else None)
 
 
 class Color:
@@ -241,27 +317,13 @@ class Color:
     format (HSL, RGB, HEX, WEB) and their partial representation.
     """
 
+    __slots__ = ("_hsl", "_rgb_cache", "_hex_cache", "_alpha", "equality")
+
     _hsl: tuple[float, float, float]  # internal representation
-    hsl: tuple[float, float, float]
-    hsla: tuple[float, float, float, float]
-    hslf: tuple[float, float, float]
-    hslaf: tuple[float, float, float, float]
-    hsv: tuple[float, float, float]
-    hex: str
-    hex_l: str
-    rgb: tuple[float, float, float]
-    rgba: tuple[float, float, float, float]
-    rgbf: tuple[float, float, float]
-    rgbaf: tuple[float, float, float, float]
-    hue: float
-    saturation: float
-    lightness: float
-    luminance: float
-    red: float
-    green: float
-    blue: float
-    alpha: float
-    web: str
+    _rgb_cache: tuple[float, float, float] | None  # derived from _hsl on demand
+    _hex_cache: str | None  # derived from _hsl on demand
+    _alpha: float
+    equality: Callable[[Color, Color], bool]
 
     def __init__(  # noqa: C901
         self,
@@ -287,28 +349,23 @@ class Color:
         **kwargs,
     ):
         # checks
-        if (
-            sum(
-                v is not None
-                for v in (
-                    color,
-                    web,
-                    hsl,
-                    hsla,
-                    hslf,
-                    hslaf,
-                    hsv,
-                    hex,
-                    hex_l,
-                    rgb,
-                    rgba,
-                    rgbf,
-                    rgbaf,
-                    pick_for,
-                )
-            )
-            != 1
-        ):
+        inputs = (
+            color,
+            web,
+            hsl,
+            hsla,
+            hslf,
+            hslaf,
+            hsv,
+            hex,
+            hex_l,
+            rgb,
+            rgba,
+            rgbf,
+            rgbaf,
+            pick_for,
+        )
+        if len([v for v in inputs if v is not None]) != 1:
             raise ValueError(
                 "Only one of 'color', 'web', 'hsl', 'hsla', 'hslf', 'hslaf', 'hex', 'hex_l', 'rgb', 'rgba', 'rgbf', 'rgbaf' or 'pick_for' may be entered."
             )
@@ -321,9 +378,12 @@ class Color:
             self.hsl = func(color)
         elif web is not None:
             web = web.lower()
-            self.hsl = web2hsl(web)
+            if web in COLOR_NAME_TO_RGB:
+                self.hsl = _cached_hsl_from_web(web)
+            else:
+                self.hsl = web2hsl(web)
         elif hsl is not None:
-            self.hsl = hsl  # type: ignore
+            self.hsl = hsl
         elif hsla is not None:
             if alpha is not None and alpha != hsla[3]:
                 raise ValueError(
@@ -360,8 +420,6 @@ class Color:
             self.hsl, alpha = rgbaf2hsl(rgbaf), rgbaf[3]
         elif pick_for is not None:
             self.hsl = web2hsl(picker(pick_key(pick_for)).web)
-        # elif isinstance(color, Color):
-        #     self.web = web2hsl(color.web)
         else:
             raise ValueError("Input not recognised")
 
@@ -371,20 +429,18 @@ class Color:
         for k, v in kwargs.items():
             setattr(self, k, v)
 
-    def __getattr__(self, label: str):
-        if label.startswith("get_"):
-            raise AttributeError(f"'{label}' not found")
-        try:
-            return getattr(self, "get_" + label)()
-        except AttributeError as e:
-            raise AttributeError(f"'{label}' not found") from e
-
-    def __setattr__(self, label, value):
-        if label not in ["_alpha", "_hsl", "equality"]:
-            fc = getattr(self, "set_" + label)
-            fc(value)
-        else:
-            self.__dict__[label] = value
+    @classmethod
+    def _from_hsl_unchecked(
+        cls, hsl: tuple[float, float, float], alpha: float = 1.0
+    ) -> Color:
+        """Build a color from a trusted HSL tuple, skipping `__init__` validation."""
+        obj = cls.__new__(cls)
+        obj._hsl = hsl
+        obj._rgb_cache = None
+        obj._hex_cache = None
+        obj._alpha = alpha
+        obj.equality = RGB_equivalence
+        return obj
 
     def get_hsl(self) -> tuple[float, float, float]:
         return self._hsl
@@ -393,61 +449,68 @@ class Color:
         return hsl2hslf(self._hsl)
 
     def get_hex(self) -> str:
-        return rgb2hex(self.rgb)
+        return rgb2hex(self.get_rgb())
 
     def get_hex_l(self) -> str:
-        return rgb2hex(self.rgb, force_long=True)
+        if self._hex_cache is None:
+            self._hex_cache = rgb2hex(self.get_rgb(), force_long=True)
+        return self._hex_cache
 
     def get_rgb(self) -> tuple[float, float, float]:
-        return hsl2rgb(self.hsl)
+        if self._rgb_cache is None:
+            self._rgb_cache = _hsl2rgb(self._hsl)
+        return self._rgb_cache
 
     def get_rgbf(self) -> tuple[float, float, float]:
-        return hsl2rgbf(self.hsl)
+        return rgb2rgbf(self.get_rgb())
 
     def get_rgba(self) -> tuple[float, float, float, float]:
-        return rgb2rgba(hsl2rgb(self.hsl), self._alpha)
+        return rgb2rgba(self.get_rgb(), self._alpha)
 
     def get_rgbaf(self) -> tuple[float, float, float, float]:
-        return rgb2rgbaf(hsl2rgb(self.hsl), self._alpha)
+        return rgb2rgbaf(self.get_rgb(), self._alpha)
 
     def get_hsla(self) -> tuple[float, float, float, float]:
-        return hsl2hsla(self.hsl, self._alpha)
+        return hsl2hsla(self._hsl, self._alpha)
 
     def get_hslaf(self) -> tuple[float, float, float, float]:
-        return hsl2hslaf(self.hsl, self._alpha)
+        return hsl2hslaf(self._hsl, self._alpha)
 
     def get_hue(self) -> float:
-        return self.hsl[0]
+        return self._hsl[0]
 
     def get_saturation(self) -> float:
-        return self.hsl[1]
+        return self._hsl[1]
 
     def get_lightness(self) -> float:
-        return self.hsl[2]
+        return self._hsl[2]
 
     def get_luminance(self) -> float:
         r, g, b = self.get_rgbf()
-        return math.sqrt(0.299 * r**2 + 0.587 * g**2 + 0.114 * b**2)
+        return math.sqrt(0.299 * (r * r) + 0.587 * (g * g) + 0.114 * (b * b))
 
     def get_red(self) -> float:
-        return self.rgb[0]
+        return self.get_rgb()[0]
 
     def get_green(self) -> float:
-        return self.rgb[1]
+        return self.get_rgb()[1]
 
     def get_blue(self) -> float:
-        return self.rgb[2]
+        return self.get_rgb()[2]
 
     def get_alpha(self) -> float:
         return self._alpha
 
     def get_web(self) -> str:
-        return hex2web(self.hex)
+        return hex2web(self.get_hex())
 
     def set_hsl(self, value: Sequence[float]) -> None:
         if not is_hsl(value):
             raise TypeError("Value is not a valid HSL")
         self._hsl = tuple(value)  # type: ignore
+        # every setter funnels through here, so this is the only invalidation
+        self._rgb_cache = None
+        self._hex_cache = None
 
     def set_rgb(self, value: Sequence[float]) -> None:
         self.hsl = rgb2hsl(value)
@@ -493,6 +556,26 @@ class Color:
     def set_web(self, value: str) -> None:
         self.hex = web2hex(value)
 
+    hsl = _color_property("hsl")
+    hslf = _color_property("hslf", settable=False)
+    hsla = _color_property("hsla", settable=False)
+    hslaf = _color_property("hslaf", settable=False)
+    hex = _color_property("hex")
+    hex_l = _color_property("hex_l")
+    rgb = _color_property("rgb")
+    rgbf = _color_property("rgbf")
+    rgba = _color_property("rgba")
+    rgbaf = _color_property("rgbaf")
+    hue = _color_property("hue")
+    saturation = _color_property("saturation")
+    lightness = _color_property("lightness")
+    luminance = _color_property("luminance", settable=False)
+    red = _color_property("red")
+    green = _color_property("green")
+    blue = _color_property("blue")
+    alpha = _color_property("alpha")
+    web = _color_property("web")
+
     def range_to(
         self, value: str | Sequence[int | float] | Color, steps, longer=False
     ) -> Generator[Color, None, None]:
@@ -529,7 +612,8 @@ class Color:
         raise NotImplementedError("Other object must be of type `Color` or `Colour`")
 
 
-class Colour(Color): ...
+class Colour(Color):
+    __slots__ = ()
 
 
 def make_color_factory(**kwargs_defaults):
@@ -1,23 +1,24 @@
-import re
 from collections.abc import Sequence
 
 from .definitions import (
     COLOR_NAME_TO_RGB,
+    COLOR_NAME_TO_RGB_INT,
     FLOAT_ERROR,
-    LONG_HEX_COLOR,
+    HEX_COLOR,
+    PALETTE_NAMES,
+    PALETTE_RGB,
+    RGB_INT_TO_COLOR_NAME,
     RGB_TO_COLOR_NAMES,
-    SHORT_HEX_COLOR,
 )
 from .identify import (
+    is_hex,
     is_hsl,
     is_hsla,
     is_hslf,
-    is_long_hex,
     is_rgb,
     is_rgba,
     is_rgbaf,
     is_rgbf,
-    is_short_hex,
     is_web,
 )
 
@@ -134,28 +135,29 @@ def hsl2rgb(hsl: Sequence[int | float]) -> tuple[float, float, float]:
     """
     if not is_hsl(hsl):
         raise ValueError("Input is not an HSL type.")
+    return _hsl2rgb(hsl)
 
-    _h, _s, _l = [float(v) for v in hsl]
+
+def _hsl2rgb(hsl: Sequence[int | float]) -> tuple[float, float, float]:
+    """`hsl2rgb` without input validation, for HSL values known to be valid."""
+    _h, _s, _l = hsl
     _h /= 360.0
     _s /= 100.0
     _l /= 100.0
 
     if _s == 0:
-        return (
-            _threshold(_l * 255.0),
-            _threshold(_l * 255.0),
-            _threshold(_l * 255.0),
-        )
+        v = _threshold(_l * 255.0)
+        return (v, v, v)
 
     v2 = _l * (1.0 + _s) if _l < 0.5 else (_l + _s) - (_s * _l)
 
     v1 = 2.0 * _l - v2
 
-    r = _hue2rgb(v1, v2, _h + (1.0 / 3))
-    g = _hue2rgb(v1, v2, _h)
-    b = _hue2rgb(v1, v2, _h - (1.0 / 3))
-
-    return rgbf2rgb((r, g, b))
+    return (
+        _threshold(_hue2rgb(v1, v2, _h + (1.0 / 3)) * 255.0),
+        _threshold(_hue2rgb(v1, v2, _h) * 255.0),
+        _threshold(_hue2rgb(v1, v2, _h - (1.0 / 3)) * 255.0),
+    )
 
 
 def hsl2rgbf(hsl: Sequence[int | float]) -> tuple[float, float, float]:
@@ -165,13 +167,13 @@ def hsl2rgbf(hsl: Sequence[int | float]) -> tuple[float, float, float]:
 def rgba2hsl(rgba: Sequence[int | float]) -> tuple[float, float, float]:
     if not is_rgba(rgba):
         raise ValueError("Input is not an RGBA type.")
-    return rgb2hsl(rgba[:3])
+    return _rgb2hsl(rgba[:3])
 
 
 def rgbaf2hsl(rgbaf: Sequence[int | float]) -> tuple[float, float, float]:
     if not is_rgbaf(rgbaf):
         raise ValueError("Input is not an RGBAf type.")
-    return rgb2hsl(rgbf2rgb(rgbaf[:3]))
+    return _rgb2hsl(rgbf2rgb(rgbaf[:3]))
 
 
 def hsla2hsl(hsla: Sequence[int | float]) -> tuple[float, float, float]:
@@ -183,7 +185,7 @@ def hsla2hsl(hsla: Sequence[int | float]) -> tuple[float, float, float]:
 def rgbf2hsl(rgbf: Sequence[int | float]) -> tuple[float, float, float]:
     if not is_rgbf(rgbf):
         raise ValueError("Input is not an RGBf type.")
-    return rgb2hsl(rgbf2rgb(rgbf))
+    return _rgb2hsl(rgbf2rgb(rgbf))
 
 
 def rgb2hsl(rgb: Sequence[int | float]) -> tuple[float, float, float]:
@@ -199,6 +201,11 @@ def rgb2hsl(rgb: Sequence[int | float]) -> tuple[float, float, float]:
     """
     if not is_rgb(rgb):
         raise ValueError("Input is not an RGB type.")
+    return _rgb2hsl(rgb)
+
+
+def _rgb2hsl(rgb: Sequence[int | float]) -> tuple[float, float, float]:
+    """`rgb2hsl` without input validation, for RGB values known to be valid."""
     r, g, b = rgb2rgbf(rgb)
 
     vmin = min(r, g, b)  ## Min. value of RGB
@@ -272,13 +279,23 @@ def rgb2hex(rgb: Sequence[int | float], force_long: bool = False) -> str:
     """
     if not is_rgb(rgb):
         raise ValueError("Input is not of RGB type.")
+    return _rgb2hex(rgb, force_long)
 
-    hx = "".join([f"{int(c + 0.5 - FLOAT_ERROR):02x}" for c in rgb])
 
-    if not force_long and hx[0::2] == hx[1::2]:
-        hx = "".join(hx[0::2])
+def _rgb2hex(rgb: Sequence[int | float], force_long: bool = False) -> str:
+    """`rgb2hex` without input validation, for RGB values known to be valid."""
+    r, g, b = rgb
+    hx = bytes(
+        (
+            int(r + 0.5 - FLOAT_ERROR),
+            int(g + 0.5 - FLOAT_ERROR),
+            int(b + 0.5 - FLOAT_ERROR),
+        )
+    ).hex()
 
-    return f"#{hx}"
+    if not force_long and hx[0] == hx[1] and hx[2] == hx[3] and hx[4] == hx[5]:
+        return "#" + hx[0] + hx[2] + hx[4]
+    return "#" + hx
 
 
 def hex2rgb(hex: str) -> tuple[float, float, float]:
@@ -288,26 +305,18 @@ def hex2rgb(hex: str) -> tuple[float, float, float]:
     :rtype: RGB 3-uple of float between 0 and 1
     """
 
-    if not (is_long_hex(hex) or is_short_hex(hex)):
+    if not is_hex(hex):
         raise ValueError("Input is not of hex type.")
 
-    try:
-        rgb = hex[1:]
+    if len(hex) == 4:
+        hex = "#" + hex[1] * 2 + hex[2] * 2 + hex[3] * 2
+    r, g, b = bytes.fromhex(hex[1:])
+    return (float(r), float(g), float(b))
 
-        if len(rgb) == 6:
-            r, g, b = rgb[0:2], rgb[2:4], rgb[4:6]
-        elif len(rgb) == 3:
-            r, g, b = rgb[0] * 2, rgb[1] * 2, rgb[2] * 2
-        else:
-            raise ValueError("Length of rgb must be either three or six.")
-    except Exception as e:
-        raise ValueError(f"Invalid value {hex} provided for rgb color.") from e
 
-    return (
-        _threshold(float(int(r, 16))),
-        _threshold(float(int(g, 16))),
-        _threshold(float(int(b, 16))),
-    )
+def _web_name(color_name: str) -> str:
+    ## Enforce full lowercase for single worded color name.
+    return color_name if sum(map(str.isupper, color_name)) > 1 else color_name.lower()
 
 
 def hex2web(hex: str) -> str:
@@ -319,22 +328,15 @@ def hex2web(hex: str) -> str:
     WEB representation uses X11 rgb.txt to define conversion
     between RGB and english color names.
     """
-    if not (is_long_hex(hex) or is_short_hex(hex)):
+    if not is_hex(hex):
         raise ValueError("Input is not of hex type.")
 
-    rgb = hex2rgb(hex)
-    dec_rgb = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
-    if dec_rgb in RGB_TO_COLOR_NAMES:
-        ## take the first one
-        color_name = RGB_TO_COLOR_NAMES[dec_rgb][0]
-        ## Enforce full lowercase for single worded color name.
-        return (
-            color_name
-            if len(re.sub(r"[^A-Z]", "", color_name)) > 1
-            else color_name.lower()
-        )
+    long_hex = hex if len(hex) == 7 else "#" + hex[1] * 2 + hex[2] * 2 + hex[3] * 2
+    name = RGB_INT_TO_COLOR_NAME.get(int(long_hex[1:], 16))
+    if name is not None:
+        return _web_name(name)
 
-    # Hex format is verified by hex2rgb function. And should be 3 or 6 digit
+    # Hex format is verified by is_hex function. And should be 3 or 6 digit
     if len(hex) == 7 and hex[1] == hex[2] and hex[3] == hex[4] and hex[5] == hex[6]:
         return "#" + hex[1] + hex[3] + hex[5]
     return hex
@@ -351,11 +353,12 @@ def web2hex(web: str, force_long=False) -> str:
     """
     web = web.lower()
     if web.startswith("#"):
-        if LONG_HEX_COLOR.match(web) or (not force_long and SHORT_HEX_COLOR.match(web)):
-            return web.lower()
-        elif SHORT_HEX_COLOR.match(web) and force_long:
+        match = HEX_COLOR.fullmatch(web)
+        if match is None:
+            raise AttributeError(f"{web} is not in web format. Need 3 or 6 hex digit.")
+        if force_long and match.lastgroup == "short":
             return "#" + "".join([str(t) * 2 for t in web[1:]])
-        raise AttributeError(f"{web} is not in web format. Need 3 or 6 hex digit.")
+        return web
 
     if not is_web(web):
         raise ValueError("Input is not of web type.")
@@ -367,13 +370,13 @@ def web2hex(web: str, force_long=False) -> str:
 def hsl2hex(hsl: Sequence[int | float]) -> str:
     if not is_hsl(hsl):
         raise ValueError("Input is not of hsl type.")
-    return rgb2hex(hsl2rgb(hsl))
+    return _rgb2hex(_hsl2rgb(hsl))
 
 
 def hex2hsl(hex: str) -> tuple[float, float, float]:
-    if not (is_long_hex(hex) or is_short_hex(hex)):
+    if not is_hex(hex):
         raise ValueError("Input is not of hex type.")
-    return rgb2hsl(hex2rgb(hex))
+    return _rgb2hsl(hex2rgb(hex))
 
 
 def rgb2web(rgb: Sequence[int | float]) -> str:
@@ -382,19 +385,42 @@ def rgb2web(rgb: Sequence[int | float]) -> str:
     return hex2web(rgb2hex(rgb))
 
 
+def rgb2nearest_web(rgb: Sequence[int | float]) -> str:
+    """Name of the web color closest to an RGB color
+
+    :param rgb: RGB 3-uple of float between 0 and 255
+    :rtype: color name, closest by euclidean distance in RGB space
+    """
+    if not is_rgb(rgb):
+        raise ValueError("Input is not an RGB type.")
+    r, g, b = rgb
+    names = RGB_TO_COLOR_NAMES.get((r, g, b))  # type: ignore[arg-type]
+    if names is not None:
+        return _web_name(names[0])
+
+    distances = [
+        (pr - r) * (pr - r) + (pg - g) * (pg - g) + (pb - b) * (pb - b)
+        for pr, pg, pb in PALETTE_RGB
+    ]
+    return _web_name(PALETTE_NAMES[distances.index(min(distances))])
+
+
 def web2rgb(web: str) -> tuple[float, float, float]:
     if not is_web(web):
         raise ValueError("Input is not of web type.")
-    return hex2rgb(web2hex(web))
+    if web.startswith("#"):
+        return hex2rgb(web)
+    v = COLOR_NAME_TO_RGB_INT[web]
+    return (float(v >> 16), float((v >> 8) & 0xFF), float(v & 0xFF))
 
 
 def web2hsl(web: str) -> tuple[float, float, float]:
     if not is_web(web):
         raise ValueError("Input is not an web type.")
-    return rgb2hsl(web2rgb(web))
+    return _rgb2hsl(web2rgb(web))
 
 
 def hsl2web(hsl: Sequence[int | float]) -> str:
     if not is_hsl(hsl):
         raise ValueError("Input is not an HSL type.")
-    return rgb2web(hsl2rgb(hsl))
+    return rgb2web(_hsl2rgb(hsl))
@@ -1,4 +1,5 @@
 import re
+import sys
 
 ## Soften inequalities and some rounding issue based on float
 FLOAT_ERROR = 0.0000005
@@ -149,14 +150,36 @@ RGB_TO_COLOR_NAMES = {
     (255, 255, 255): ["White"],
 }
 
+## The tables below, and the HSL/RGB/HEX tables in colour.py, are derived from
+## RGB_TO_COLOR_NAMES at import time. None of these tables may be mutated,
+## RGB_TO_COLOR_NAMES included, as the derived ones would not follow.
+
 ## Building inverse relation
 COLOR_NAME_TO_RGB = {
-    name.lower(): rgb for rgb, names in RGB_TO_COLOR_NAMES.items() for name in names
+    sys.intern(name.lower()): rgb
+    for rgb, names in RGB_TO_COLOR_NAMES.items()
+    for name in names
+}
+## Same, with the RGB values packed into a single 0xRRGGBB integer
+COLOR_NAME_TO_RGB_INT = {
+    name: (r << 16) | (g << 8) | b for name, (r, g, b) in COLOR_NAME_TO_RGB.items()
 }
+## Packed 0xRRGGBB integer to the first name of that color
+RGB_INT_TO_COLOR_NAME = {
+    (r << 16) | (g << 8) | b: names[0]
+    for (r, g, b), names in RGB_TO_COLOR_NAMES.items()
+}
+
+## Parallel sequences of every named RGB value and its first name, for searches
+## over the whole palette
+PALETTE_RGB = tuple(RGB_TO_COLOR_NAMES)
+PALETTE_NAMES = tuple(names[0] for names in RGB_TO_COLOR_NAMES.values())
 
 
 LONG_HEX_COLOR = re.compile(r"^#[0-9a-fA-F]{6}$")
 SHORT_HEX_COLOR = re.compile(r"^#[0-9a-fA-F]{3}$")
+## Either hex form in one pattern, the matching group tells which one it is
+HEX_COLOR = re.compile(r"#(?:(?P<long>[0-9a-fA-F]{6})|(?P<short>[0-9a-fA-F]{3}))")
 
 
 def linspace(
@@ -182,8 +205,6 @@ def linspace(
     """
     if num <= 0:
         return []
-    if num == 1:
-        return [start]
-    step = (stop - start) / (num - 1) if endpoint else (stop - start) / num
-    result = [float(start + step * i) for i in range(num)]
-    return result
+    start = float(start)
+    step = 0.0 if num == 1 else (stop - start) / (num - 1 if endpoint else num)
+    return [start + step * i for i in range(num)]
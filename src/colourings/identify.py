@@ -1,7 +1,11 @@
 from collections.abc import Sequence
 from typing import Any
 
-from .definitions import COLOR_NAME_TO_RGB, LONG_HEX_COLOR, SHORT_HEX_COLOR
+from .definitions import COLOR_NAME_TO_RGB, HEX_COLOR, LONG_HEX_COLOR, SHORT_HEX_COLOR
+
+_match_hex = HEX_COLOR.fullmatch
+## Tuple rather than int | float, isinstance is faster with it
+_NUMBER = (int, float)
 
 
 def is_long_hex(color: str) -> bool:
@@ -12,97 +16,153 @@ def is_short_hex(color: str) -> bool:
     return bool(SHORT_HEX_COLOR.fullmatch(color))
 
 
+def is_hex(color: str) -> bool:
+    return _match_hex(color) is not None
+
+
 def is_rgb(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 3:
+    try:
+        c1, c2, c3 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and 0 <= c1 <= 255
+            and 0 <= c2 <= 255
+            and 0 <= c3 <= 255
+        )
+    except (TypeError, ValueError):
         return False
-    for channel in color:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 255):
-            return False
-    return True
 
 
 def is_rgbf(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 3:
+    try:
+        c1, c2, c3 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and 0 <= c1 <= 1
+            and 0 <= c2 <= 1
+            and 0 <= c3 <= 1
+        )
+    except (TypeError, ValueError):
         return False
-    for channel in color:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 1):
-            return False
-    return True
 
 
 def is_hslf(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 3:
+    try:
+        c1, c2, c3 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and 0 <= c1 <= 1
+            and 0 <= c2 <= 1
+            and 0 <= c3 <= 1
+        )
+    except (TypeError, ValueError):
         return False
-    for channel in color:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 1):
-            return False
-    return True
 
 
 def is_rgba(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 4:
+    try:
+        c1, c2, c3, c4 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and isinstance(c4, _NUMBER)
+            and 0 <= c1 <= 255
+            and 0 <= c2 <= 255
+            and 0 <= c3 <= 255
+            and 0 <= c4 <= 255
+        )
+    except (TypeError, ValueError):
         return False
-    for channel in color:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 255):
-            return False
-    return True
 
 
 def is_rgbaf(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 4:
+    try:
+        c1, c2, c3, c4 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and isinstance(c4, _NUMBER)
+            and 0 <= c1 <= 1
+            and 0 <= c2 <= 1
+            and 0 <= c3 <= 1
+            and 0 <= c4 <= 1
+        )
+    except (TypeError, ValueError):
         return False
-    for channel in color:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 1):
-            return False
-    return True
 
 
 def is_hslaf(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 4:
+    try:
+        c1, c2, c3, c4 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and isinstance(c4, _NUMBER)
+            and 0 <= c1 <= 1
+            and 0 <= c2 <= 1
+            and 0 <= c3 <= 1
+            and 0 <= c4 <= 1
+        )
+    except (TypeError, ValueError):
         return False
-    for channel in color:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 1):
-            return False
-    return True
 
 
 def is_web(color: str) -> bool:
-    return color in COLOR_NAME_TO_RGB or is_long_hex(color) or is_short_hex(color)
+    return color in COLOR_NAME_TO_RGB or _match_hex(color) is not None
 
 
 def is_hsl(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 3:
+    try:
+        c1, c2, c3 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and 0 <= c1 <= 360
+            and 0 <= c2 <= 100
+            and 0 <= c3 <= 100
+        )
+    except (TypeError, ValueError):
         return False
-    if isinstance(color[0], int | float) and not 0 <= color[0] <= 360:
-        return False
-    for channel in color[1:]:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 100):
-            return False
-    return True
 
 
 def is_hsla(color: Any) -> bool:
     if not isinstance(color, Sequence) or isinstance(color, str):
         return False
-    if len(color) != 4:
-        return False
-    if isinstance(color[0], int | float) and not 0 <= color[0] <= 360:
+    try:
+        c1, c2, c3, c4 = color
+        return (
+            isinstance(c1, _NUMBER)
+            and isinstance(c2, _NUMBER)
+            and isinstance(c3, _NUMBER)
+            and isinstance(c4, _NUMBER)
+            and 0 <= c1 <= 360
+            and 0 <= c2 <= 100
+            and 0 <= c3 <= 100
+            and 0 <= c4 <= 100
+        )
+    except (TypeError, ValueError):
         return False
-    for channel in color[1:]:
-        if not isinstance(channel, int | float) or not (0 <= channel <= 100):
-            return False
-    return True
@@ -12,6 +12,7 @@ from colourings.colour import (
     RGB_color_picker,
     color_scale,
     colour_scale,
+    hsl_scale,
     identify_color,
     make_color_factory,
 )
@@ -234,6 +235,8 @@ def test_bad_identify_color():
 def test_RGB():
     assert RGB.WHITE == (255.0, 255.0, 255.0)
     assert RGB.BLUE == (0.0, 0.0, 255.0)
+    assert RGB.MINTCREAM == (245.0, 255.0, 250.0)
+    assert RGB.AQUA is RGB.CYAN
     with pytest.raises(AttributeError):
         RGB.DONOTEXISTS  # noqa: B018
 
@@ -241,6 +244,7 @@ def test_RGB():
 def test_HEX():
     assert HEX.WHITE == "#fff"
     assert HEX.BLUE == "#00f"
+    assert HEX.AQUA is HEX.CYAN
     with pytest.raises(AttributeError):
         HEX.DONOTEXISTS  # noqa: B018
 
@@ -367,10 +371,30 @@ def test_color_scale_num_sections():
     ]
 
 
+def test_hsl_scale():
+    colors = (Color("black"), Color("orange"), Color("blue"), Color("white"))
+    hsls = hsl_scale(colors, 12)
+    assert len(hsls) == 12
+    assert hsls[0] == (0.0, 0.0, 0.0)
+    assert hsls[-1] == (0.0, 0.0, 100.0)
+    assert hsls == [c.hsl for c in color_scale(colors, 12)]
+    with pytest.raises(ValueError):
+        hsl_scale((Color("white"),), 2)
+
+
+def test_color_scale_ends_on_last_color():
+    cs = color_scale((Color("bisque"), Color("black")), 7)
+    assert cs[-1].hsl == Color("black").hsl
+    assert cs[-1].hex == "#000"
+
+
 def test_RGB_color_picker():
     assert RGB_color_picker("Something") == RGB_color_picker("Something")
     assert RGB_color_picker("Something") != RGB_color_picker("Something else")
     assert isinstance(RGB_color_picker("Something"), Color)
+    picked = RGB_color_picker("Something")
+    picked.lightness = 0
+    assert RGB_color_picker("Something") != picked
 
 
 def test_colour():
@@ -397,6 +421,31 @@ def test_cannot_identify():
         Color((255, 0, 0))
 
 
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        Color("red", does_not_exists=1)
+    c = Colour("red")
+    with pytest.raises(AttributeError):
+        c.does_not_exists = 1  # type: ignore[attr-defined]
+
+
+def test_subclass_overrides_accessors():
+    class Upper(Color):
+        __slots__ = ()
+
+        def get_web(self) -> str:
+            return super().get_web().upper()
+
+        def set_red(self, value: float) -> None:
+            super().set_red(255 - value)
+
+    c = Upper("red")
+    assert c.web == "RED"
+    assert str(c) == "RED"
+    c.red = 255
+    assert c.get_red() == 0
+
+
 def test_color_str():
     c = Color("red")
     assert str(c) == "red"
@@ -456,9 +505,9 @@ def test_no_eq():
 def test_no_attribute():
     c = Color("red")
     with pytest.raises(AttributeError):
-        c.does_not_exists  # noqa: B018
+        c.does_not_exists  # type: ignore[attr-defined]  # noqa: B018
     with pytest.raises(AttributeError):
-        c.get_does_not_exists  # noqa: B018
+        c.get_does_not_exists  # type: ignore[attr-defined]  # noqa: B018
 
 
 def test_web1():
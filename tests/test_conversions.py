@@ -14,6 +14,7 @@ from colourings.conversions import (
     hslf2hsl,
     rgb2hex,
     rgb2hsl,
+    rgb2nearest_web,
     rgb2web,
     rgba2hsl,
     rgbaf2hsl,
@@ -29,8 +30,19 @@ def test_rgb2web():
     assert rgb2web((0.0, 0.0, 0.0)) == "black"
 
 
+def test_rgb2nearest_web():
+    assert rgb2nearest_web((255, 0, 0)) == "red"
+    assert rgb2nearest_web((255.0, 0.0, 0.0)) == "red"
+    assert rgb2nearest_web((250, 5, 3)) == "red"
+    assert rgb2nearest_web((100, 100, 100)) == "DimGray"
+    with pytest.raises(ValueError):
+        rgb2nearest_web((300, 0, 0))
+
+
 def test_web2rgb():
     assert web2rgb("black") == (0.0, 0.0, 0.0)
+    assert web2rgb("orangered") == (255.0, 69.0, 0.0)
+    assert web2rgb("#ff4500") == (255.0, 69.0, 0.0)
 
 
 def test_web2hsl():
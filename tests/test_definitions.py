@@ -1,4 +1,9 @@
-from colourings.definitions import linspace
+from colourings.definitions import (
+    COLOR_NAME_TO_RGB,
+    COLOR_NAME_TO_RGB_INT,
+    RGB_INT_TO_COLOR_NAME,
+    linspace,
+)
 
 
 def test_bad_linspace():
@@ -15,3 +20,9 @@ def test_end_linspace():
 
 def test_linspace_one_num():
     assert linspace(1, 10, 1) == [1]
+
+
+def test_color_name_tables():
+    assert COLOR_NAME_TO_RGB_INT["orangered"] == 0xFF4500
+    assert COLOR_NAME_TO_RGB_INT.keys() == COLOR_NAME_TO_RGB.keys()
+    assert RGB_INT_TO_COLOR_NAME[0x00FFFF] == "Cyan"
@@ -1,5 +1,8 @@
+from decimal import Decimal
+
 from colourings import Color
 from colourings.identify import (
+    is_hex,
     is_hsl,
     is_hsla,
     is_hslaf,
@@ -11,11 +14,22 @@ from colourings.identify import (
 )
 
 
+def test_is_hex():
+    assert is_hex("#abc")
+    assert is_hex("#AbCdEf")
+    assert not is_hex("#abcd")
+    assert not is_hex("abc")
+    assert not is_hex("#abcdef\n")
+
+
 def test_bad_rbg():
     assert not is_rgb((300, 0, 0))
     assert not is_rgb((30, 300, 0, 0))
     assert not is_rgb("30, 300, 0, 0")
     assert not is_rgb(int)
+    assert not is_rgb((0, "0", 0))
+    assert not is_rgb((0, None, 0))
+    assert not is_rgb((Decimal(1), 0, 0))
 
 
 def test_bad_rbgf():
@@ -44,6 +58,9 @@ def test_bad_hsl():
     assert not is_hsl((30, 300, 0, 0))
     assert not is_hsl("30, 300, 0, 0")
     assert not is_hsl(int)
+    assert not is_hsl((None, 0, 0))
+    assert not is_hsl(("0", 0, 0))
+    assert not is_hsl((0, 0, Decimal(1)))
 
 
 def test_bad_hsla():